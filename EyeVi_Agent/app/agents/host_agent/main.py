@@ -3,14 +3,25 @@ Host Agent - FastAPI Server
 Orchestrator agent để điều phối message tới các agent khác
 """
 
-from fastapi import FastAPI, HTTPException, File, UploadFile, Form
+from fastapi import FastAPI, HTTPException, File, UploadFile, Form, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+import msgspec
 from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 import asyncio
 import os
 import logging
 import base64
+import operator
+import httpx
 from datetime import datetime
+from itertools import islice
+from uuid import uuid4
+
+from cachetools import TTLCache
 
 # Import các modules local
 from server.host_server import HostServer
@@ -20,23 +31,133 @@ from server.a2a_client_manager import FileInfo
 import dotenv
 dotenv.load_dotenv()
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging - level điều chỉnh được qua env (production nên đặt WARNING)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Khởi tạo resources khi server start và cleanup khi shutdown"""
+    logger.info("🚀 Host Agent Server đang khởi động...")
+    
+    # HTTP client dùng chung cho mọi outbound agent call - giữ keep-alive
+    # connections để không phải handshake TCP/TLS lại mỗi request
+    app.state.http = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    
+    # Thread pool riêng cho CPU-bound work (base64 encode) để không
+    # chiếm default executor và không block event loop
+    app.state.cpu_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    
+    await host_server.initialize(http_client=app.state.http)
+    logger.info("✅ Host Agent Server đã sẵn sàng!")
+    
+    yield
+    
+    logger.info("🔄 Host Agent Server đang shutdown...")
+    await host_server.cleanup()
+    await app.state.http.aclose()
+    app.state.cpu_pool.shutdown(wait=False)
+    logger.info("✅ Host Agent Server đã shutdown thành công!")
+
 # Khởi tạo FastAPI app
 app = FastAPI(
     title="Host Agent API",
     description="Orchestrator agent để điều phối message tới các agent khác",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Nén các response JSON lớn (session list, chat history) bằng gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+@app.middleware("http")
+async def reject_oversized_requests(request: Request, call_next):
+    """
+    Reject sớm request quá lớn dựa trên Content-Length header - chạy
+    trước routing/body read nên python-multipart không phải parse body
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > UPLOAD_MAX_SIZE:
+            return ORJSONResponse(
+                status_code=413,
+                content={"detail": f"Request quá lớn (tối đa {UPLOAD_MAX_SIZE} bytes)"}
+            )
+    elif request.method == "POST" and request.headers.get("content-type", "").startswith("multipart/"):
+        # Multipart không khai báo Content-Length hợp lệ (vd Transfer-Encoding:
+        # chunked) thì không thể kiểm soát size trước khi parse - reject luôn,
+        # nếu không UPLOAD_MAX_SIZE sẽ bị bypass hoàn toàn
+        return ORJSONResponse(
+            status_code=411,
+            content={"detail": "Multipart upload yêu cầu Content-Length header hợp lệ"}
+        )
+    return await call_next(request)
+
 # Khởi tạo host server
 host_server = HostServer()
 
-# Models cho request/response
-class ChatResponse(BaseModel):
+# Front cache cho chat history đọc lặp lại (UI polling) - key (user_id, session_id)
+# TTL ngắn để data không bị stale quá lâu khi có writer khác
+history_cache: TTLCache = TTLCache(maxsize=1024, ttl=5)
+
+# Chunk size cho việc đọc file upload - bội số của 3 bytes
+# để mỗi chunk encode base64 độc lập không bị lệch padding
+UPLOAD_CHUNK_SIZE = 64 * 1024 * 3
+
+# Giới hạn kích thước request upload (bytes) - mặc định 50MB
+UPLOAD_MAX_SIZE = int(os.getenv("UPLOAD_MAX_SIZE", str(50 * 1024 * 1024)))
+
+# File lớn hơn ngưỡng này sẽ được encode trên CPU pool thay vì inline
+# trên event loop (1MB ~ vài trăm micro giây encode mỗi chunk)
+UPLOAD_INLINE_MAX_SIZE = int(os.getenv("UPLOAD_INLINE_MAX_SIZE", str(1024 * 1024)))
+
+async def encode_upload(file: UploadFile, use_buffering: bool = True) -> str:
+    """
+    Đọc file upload theo từng chunk và encode base64 incrementally.
+    Tránh giữ toàn bộ file content + bản encode trong RAM cùng lúc.
+
+    Args:
+        file: UploadFile cần encode
+        use_buffering: True = encode inline từng chunk (file nhỏ/vừa),
+                       False = offload encode sang CPU pool để không block event loop
+    """
+    loop = asyncio.get_running_loop()
+    cpu_pool = getattr(app.state, "cpu_pool", None)
+    encoded = bytearray()
+
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        if use_buffering:
+            encoded += base64.b64encode(chunk)
+        else:
+            encoded += await loop.run_in_executor(cpu_pool, base64.b64encode, chunk)
+
+    return encoded.decode('ascii')
+
+async def _process_upload(file: UploadFile) -> FileInfo:
+    """Đọc + encode một file upload thành FileInfo"""
+    # File nhỏ encode inline; file lớn (hoặc không rõ size) offload sang CPU pool
+    inline = file.size is not None and file.size <= UPLOAD_INLINE_MAX_SIZE
+    file_base64 = await encode_upload(file, use_buffering=inline)
+
+    # Xác định mime type
+    mime_type = file.content_type or "application/octet-stream"
+
+    logger.info("📎 Processed file: %s (%s, %s bytes)", file.filename, mime_type, file.size)
+
+    return FileInfo(
+        name=file.filename,
+        mime_type=mime_type,
+        data=file_base64
+    )
+
+# Models cho request/response - msgspec.Struct thay vì Pydantic BaseModel:
+# data là server-generated nên không cần validate, chỉ cần encode nhanh
+class ChatResponse(msgspec.Struct):
     response: str
+    timestamp: str
     agent_used: Optional[str] = None
     session_id: Optional[str] = None
     clarified_message: Optional[str] = None
@@ -45,54 +166,116 @@ class ChatResponse(BaseModel):
     user_info: Optional[dict] = None
     orders: Optional[list] = None
     status: str = "success"
-    timestamp: str
     extracted_product_ids: Optional[List[str]] = None
 
-class HealthResponse(BaseModel):
+class HealthResponse(msgspec.Struct):
     status: str
     message: str
     timestamp: str
 
-@app.on_event("startup")
-async def startup_event():
-    """Khởi tạo khi server start"""
-    logger.info("🚀 Host Agent Server đang khởi động...")
-    await host_server.initialize()
-    logger.info("✅ Host Agent Server đã sẵn sàng!")
+class ChatTextRequest(BaseModel):
+    message: str
+    user_id: Optional[str] = None
+    session_id: Optional[str] = None
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup khi server shutdown"""
-    logger.info("🔄 Host Agent Server đang shutdown...")
-    await host_server.cleanup()
-    logger.info("✅ Host Agent Server đã shutdown thành công!")
+def _json_response(struct: msgspec.Struct) -> Response:
+    """Encode msgspec Struct thành JSON response"""
+    return Response(msgspec.json.encode(struct), media_type="application/json")
 
-@app.get("/", response_model=HealthResponse)
+# Extract các fields từ result dict bằng một itemgetter call
+# thay vì chuỗi .get() lookups riêng lẻ
+_RESPONSE_FIELDS = (
+    "response", "agent_used", "session_id", "clarified_message",
+    "analysis", "data", "user_info", "orders", "extracted_product_ids"
+)
+_RESPONSE_DEFAULTS = dict.fromkeys(_RESPONSE_FIELDS)
+_extract_response_fields = operator.itemgetter(*_RESPONSE_FIELDS)
+
+@app.get("/")
 async def root():
     """Health check endpoint"""
-    return HealthResponse(
+    timestamp = datetime.now().isoformat()
+    return _json_response(HealthResponse(
         status="healthy",
         message="Host Agent Server đang hoạt động tốt!",
-        timestamp=datetime.now().isoformat()
-    )
+        timestamp=timestamp
+    ))
 
-@app.get("/health", response_model=HealthResponse)
+@app.get("/health")
 async def health():
     """Detailed health check"""
+    timestamp = datetime.now().isoformat()
     try:
-        # Kiểm tra trạng thái các agent connections
-        agent_status = await host_server.check_agents_health()
+        # Kiểm tra trạng thái các agent connections (có timeout để
+        # một agent chậm không treo toàn bộ health probe)
+        agent_status = await asyncio.wait_for(
+            host_server.check_agents_health(),
+            timeout=2.0
+        )
         
-        return HealthResponse(
+        return _json_response(HealthResponse(
             status="healthy",
             message=f"Tất cả services hoạt động tốt. Agents: {agent_status}",
-            timestamp=datetime.now().isoformat()
-        )
+            timestamp=timestamp
+        ))
+    except asyncio.TimeoutError:
+        logger.warning("⚠️ Health check timeout sau 2s")
+        return _json_response(HealthResponse(
+            status="degraded",
+            message="Health check timeout - một hoặc nhiều agents phản hồi chậm",
+            timestamp=timestamp
+        ))
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
 
-@app.post("/chat", response_model=ChatResponse)
+def _finalize_chat_result(
+    result: Dict[str, Any],
+    message: str,
+    user_id: Optional[str],
+    session_id: str,
+    timestamp: str
+) -> Response:
+    """Bump history cache và build ChatResponse từ result của host server"""
+    # Bump front cache với các messages vừa append để read-after-write
+    # nhất quán mà không cần gọi lại backend
+    if user_id:
+        cached_messages = history_cache.get((user_id, session_id))
+        if cached_messages is not None:
+            cached_messages.append({
+                "role": "user",
+                "content": message,
+                "timestamp": timestamp,
+                "agent_used": None,
+                "user_id": user_id
+            })
+            cached_messages.append({
+                "role": "assistant",
+                "content": result["response"],
+                "timestamp": timestamp,
+                "agent_used": result.get("agent_used"),
+                "user_id": user_id
+            })
+    
+    (response, agent_used, result_session_id, clarified_message,
+     analysis, data, user_info, orders, extracted_product_ids) = \
+        _extract_response_fields({**_RESPONSE_DEFAULTS, **result})
+
+    return _json_response(ChatResponse(
+        response=response,
+        agent_used=agent_used,
+        session_id=result_session_id,
+        clarified_message=clarified_message,
+        analysis=analysis,
+        data=data,
+        user_info=user_info,
+        orders=orders,
+        status="success",
+        timestamp=timestamp,
+        extracted_product_ids=extracted_product_ids
+    ))
+
+@app.post("/chat")
 async def chat(
     message: str = Form(...),
     user_id: Optional[str] = Form(None),
@@ -103,37 +286,24 @@ async def chat(
     Main endpoint để nhận message từ user và điều phối tới agent phù hợp
     Có thể kèm theo files (ảnh, document) hoặc không
     """
+    timestamp = datetime.now().isoformat()
     try:
-        logger.info(f"📨 Nhận message từ user: {message[:100]}...")
+        logger.info("📨 Nhận message từ user: %s...", message[:100])
         
         # Tự động tạo session ID nếu không có
         if not session_id:
-            from uuid import uuid4
             session_id = str(uuid4())
-            logger.info(f"🆔 Tạo session ID mới: {session_id}")
+            logger.info("🆔 Tạo session ID mới: %s", session_id)
         
-        # Xử lý files nếu có
+        # Xử lý files nếu có - lọc một lần duy nhất thay vì
+        # any() + loop riêng trên cùng list
         processed_files = None
-        if files and any(file.filename for file in files):
-            processed_files = []
-            for file in files:
-                if file.filename:  # Kiểm tra file có tồn tại
-                    # Đọc file content
-                    file_content = await file.read()
-                    
-                    # Encode thành base64
-                    file_base64 = base64.b64encode(file_content).decode('utf-8')
-                    
-                    # Xác định mime type
-                    mime_type = file.content_type or "application/octet-stream"
-                    
-                    processed_files.append(FileInfo(
-                        name=file.filename,
-                        mime_type=mime_type,
-                        data=file_base64
-                    ))
-                    
-                    logger.info(f"📎 Processed file: {file.filename} ({mime_type}, {len(file_content)} bytes)")
+        candidates = [file for file in (files or []) if file.filename]
+        if candidates:
+            # Đọc + encode các files song song thay vì tuần tự
+            processed_files = await asyncio.gather(
+                *[_process_upload(file) for file in candidates]
+            )
         
         # Xử lý message thông qua host server
         if processed_files:
@@ -152,24 +322,48 @@ async def chat(
                 session_id=session_id
             )
         
-        logger.info(f"✅ Xử lý thành công, agent được sử dụng: {result.get('agent_used', 'None')}")
+        logger.info("✅ Xử lý thành công, agent được sử dụng: %s", result.get('agent_used', 'None'))
+
+        return _finalize_chat_result(result, message, user_id, session_id, timestamp)
+        
+    except Exception as e:
+        logger.error("❌ Lỗi khi xử lý message: %s", e)
+        raise HTTPException(
+            status_code=500, 
+            detail=f"Lỗi khi xử lý message: {str(e)}"
+        )
+
+@app.post("/chat/text")
+async def chat_text(request: ChatTextRequest):
+    """
+    Fast path cho message chỉ có text (JSON body) - bỏ qua hoàn toàn
+    multipart parsing của /chat cho case phổ biến nhất
+    """
+    timestamp = datetime.now().isoformat()
+    try:
+        message = request.message
+        user_id = request.user_id
+        session_id = request.session_id
+        
+        logger.info("📨 Nhận text message từ user: %s...", message[:100])
+        
+        # Tự động tạo session ID nếu không có
+        if not session_id:
+            session_id = str(uuid4())
+            logger.info("🆔 Tạo session ID mới: %s", session_id)
         
-        return ChatResponse(
-            response=result["response"],
-            agent_used=result.get("agent_used"),
-            session_id=result.get("session_id"),
-            clarified_message=result.get("clarified_message"),
-            analysis=result.get("analysis"),
-            data=result.get("data"),
-            user_info=result.get("user_info"),
-            orders=result.get("orders"),
-            status="success",
-            timestamp=datetime.now().isoformat(),
-            extracted_product_ids=result.get("extracted_product_ids")
+        result = await host_server.process_message(
+            message=message,
+            user_id=user_id,
+            session_id=session_id
         )
         
+        logger.info("✅ Xử lý thành công, agent được sử dụng: %s", result.get('agent_used', 'None'))
+
+        return _finalize_chat_result(result, message, user_id, session_id, timestamp)
+        
     except Exception as e:
-        logger.error(f"❌ Lỗi khi xử lý message: {e}")
+        logger.error("❌ Lỗi khi xử lý message: %s", e)
         raise HTTPException(
             status_code=500, 
             detail=f"Lỗi khi xử lý message: {str(e)}"
@@ -180,25 +374,31 @@ async def chat(
 @app.get("/agents/status")
 async def get_agents_status():
     """Kiểm tra trạng thái tất cả agents"""
+    timestamp = datetime.now().isoformat()
     try:
         status = await host_server.get_all_agents_status()
         return {
             "status": "success",
             "agents": status,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     except Exception as e:
-        logger.error(f"Failed to get agents status: {e}")
+        logger.error("Failed to get agents status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 
-@app.get("/sessions/{session_id}/history")
+@app.get("/sessions/{session_id}/history", response_class=ORJSONResponse)
 async def get_chat_history(session_id: str, user_id: Optional[str] = None):
     """Lấy lịch sử chat cho session"""
     try:
         if user_id:
-            messages = await host_server.get_chat_history(user_id, session_id)
+            # Check front cache trước khi round-trip tới backend
+            cache_key = (user_id, session_id)
+            messages = history_cache.get(cache_key)
+            if messages is None:
+                messages = await host_server.get_chat_history(user_id, session_id)
+                history_cache[cache_key] = messages
         else:
             messages = host_server.get_chat_history_fallback(session_id)
         
@@ -225,15 +425,18 @@ async def get_chat_history(session_id: str, user_id: Optional[str] = None):
         }
         
     except Exception as e:
-        logger.error(f"Failed to get chat history for session {session_id}: {e}")
+        logger.error("Failed to get chat history for session %s: %s", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/sessions/{session_id}/history")
 async def clear_chat_history(session_id: str, user_id: Optional[str] = None):
     """Xóa lịch sử chat cho session"""
+    timestamp = datetime.now().isoformat()
     try:
         if user_id:
             await host_server.clear_chat_history(user_id, session_id)
+            # Invalidate front cache để không trả lại history đã xóa
+            history_cache.pop((user_id, session_id), None)
         else:
             host_server.clear_chat_history_fallback(session_id)
         
@@ -242,102 +445,127 @@ async def clear_chat_history(session_id: str, user_id: Optional[str] = None):
             "session_id": session_id,
             "user_id": user_id,
             "message": "Đã xóa lịch sử chat thành công",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
     except Exception as e:
-        logger.error(f"Failed to clear chat history for session {session_id}: {e}")
+        logger.error("Failed to clear chat history for session %s: %s", session_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/sessions/create")
 async def create_new_session():
     """Tạo session ID mới"""
+    timestamp = datetime.now().isoformat()
     try:
-        # Import uuid để tạo session ID
-        from uuid import uuid4
-        
         # Tạo session ID mới
         new_session_id = str(uuid4())
         
         # Khởi tạo chat history cho session mới
         host_server.a2a_client_manager._ensure_chat_history(new_session_id)
         
-        logger.info(f"✅ Đã tạo session mới: {new_session_id}")
+        logger.info("✅ Đã tạo session mới: %s", new_session_id)
         
         return {
             "status": "success",
             "session_id": new_session_id,
             "message": "Session mới đã được tạo thành công",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
     except Exception as e:
-        logger.error(f"Failed to create new session: {e}")
+        logger.error("Failed to create new session: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/sessions")
-async def list_active_sessions():
-    """Liệt kê các session đang active"""
+@app.get("/sessions", response_class=ORJSONResponse)
+async def list_active_sessions(limit: int = Query(50, ge=1), offset: int = Query(0, ge=0)):
+    """Liệt kê các session đang active (phân trang với limit/offset)"""
+    timestamp = datetime.now().isoformat()
     try:
-        # Lấy tất cả chat histories từ A2A client manager
+        # Chỉ materialize đúng trang được yêu cầu thay vì toàn bộ sessions
+        chat_histories = host_server.a2a_client_manager.chat_histories
         sessions_info = []
         
-        for session_id, chat_history in host_server.a2a_client_manager.chat_histories.items():
+        for session_id, chat_history in islice(chat_histories.items(), offset, offset + limit):
+            # Đọc preview/count đã được cache sẵn trên ChatHistory,
+            # không cần slice lại message cuối của từng session.
+            # Datetime thô được orjson serialize trực tiếp trong C
+            # (handler trả ORJSONResponse nên không qua jsonable_encoder)
             sessions_info.append({
                 "session_id": session_id,
-                "created_at": chat_history.created_at.isoformat(),
-                "last_updated": chat_history.last_updated.isoformat(),
-                "message_count": len(chat_history.messages),
-                "last_message_preview": chat_history.messages[-1]["content"][:100] + "..." if chat_history.messages else ""
+                "created_at": chat_history.created_at,
+                "last_updated": chat_history.last_updated,
+                "message_count": chat_history.message_count,
+                "last_message_preview": chat_history.last_message_preview
             })
         
-        return {
+        # Trả ORJSONResponse trực tiếp để bypass jsonable_encoder -
+        # return dict thường vẫn bị encode ở Python level trước khi render
+        return ORJSONResponse({
             "status": "success",
-            "active_sessions": len(sessions_info),
+            "active_sessions": len(chat_histories),
+            "returned_sessions": len(sessions_info),
+            "limit": limit,
+            "offset": offset,
             "sessions": sessions_info,
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": timestamp
+        })
         
     except Exception as e:
-        logger.error(f"Failed to list active sessions: {e}")
+        logger.error("Failed to list active sessions: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/users/{user_id}/sessions")
+@app.get("/users/{user_id}/sessions", response_class=ORJSONResponse)
 async def get_user_sessions(user_id: str):
     """Lấy danh sách tất cả sessions của user"""
+    timestamp = datetime.now().isoformat()
     try:
         sessions = await host_server.get_user_sessions(user_id)
-        
-        # Lấy thông tin chi tiết cho từng session
+
+        # Fetch chi tiết các sessions song song (giới hạn concurrency để không quá tải backend)
+        semaphore = asyncio.Semaphore(16)
+
+        async def fetch_history(session_id: str):
+            async with semaphore:
+                return await host_server.get_chat_history(user_id, session_id)
+
+        histories = await asyncio.gather(
+            *[fetch_history(session_id) for session_id in sessions],
+            return_exceptions=True
+        )
+
+        # Build thông tin chi tiết cho từng session
         sessions_info = []
-        for session_id in sessions:
+        for session_id, chat_history in zip(sessions, histories):
             try:
-                chat_history = await host_server.get_chat_history(user_id, session_id)
+                if isinstance(chat_history, Exception):
+                    raise chat_history
                 if chat_history:
                     sessions_info.append({
                         "session_id": session_id,
-                        "created_at": chat_history.created_at.isoformat(),
-                        "last_updated": chat_history.last_updated.isoformat(),
+                        "created_at": chat_history.created_at,
+                        "last_updated": chat_history.last_updated,
                         "message_count": len(chat_history.messages),
                         "last_message_preview": chat_history.messages[-1]["content"][:100] + "..." if chat_history.messages else ""
                     })
             except Exception as e:
-                logger.warning(f"Cannot get details for session {session_id}: {e}")
+                logger.warning("Cannot get details for session %s: %s", session_id, e)
                 sessions_info.append({
                     "session_id": session_id,
                     "error": "Cannot retrieve details"
                 })
         
-        return {
+        # Trả ORJSONResponse trực tiếp để bypass jsonable_encoder
+        # (datetime thô trong sessions_info được serialize trong C)
+        return ORJSONResponse({
             "status": "success",
             "user_id": user_id,
             "total_sessions": len(sessions_info),
             "sessions": sessions_info,
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": timestamp
+        })
         
     except Exception as e:
-        logger.error(f"Failed to get user sessions for {user_id}: {e}")
+        logger.error("Failed to get user sessions for %s: %s", user_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
@@ -346,13 +574,19 @@ if __name__ == "__main__":
     # Lấy config từ environment variables
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
-    
-    logger.info(f"🚀 Khởi động Host Agent Server tại {host}:{port}")
-    
+    # Reload chỉ dành cho development - bật qua RELOAD=1
+    reload = os.getenv("RELOAD") == "1"
+    workers = int(os.getenv("WORKERS", "1"))
+
+    logger.info("🚀 Khởi động Host Agent Server tại %s:%s", host, port)
+
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
-        reload=True,
-        log_level="info"
+        reload=reload,
+        loop="uvloop",
+        http="httptools",
+        log_level="info",
+        workers=workers
     )
@@ -26,12 +26,15 @@ def main():
         # Lấy config từ environment variables
         host = os.getenv("HOST", "0.0.0.0")
         port = int(os.getenv("PORT", "8080"))
-        reload = os.getenv("RELOAD", "true").lower() == "true"
+        # Reload chỉ dành cho development - bật qua RELOAD=1
+        reload = os.getenv("RELOAD") == "1"
+        workers = int(os.getenv("WORKERS", "1"))
         
         logger.info("🚀 Đang khởi động Host Agent Server...")
         logger.info(f"📍 Host: {host}")
         logger.info(f"🔌 Port: {port}")
         logger.info(f"🔄 Reload: {reload}")
+        logger.info(f"👷 Workers: {workers}")
         
         # Kiểm tra GOOGLE_API_KEY
         if not os.getenv("GOOGLE_API_KEY"):
@@ -44,8 +47,11 @@ def main():
             host=host,
             port=port,
             reload=reload,
+            loop="uvloop",
+            http="httptools",
             log_level="info",
-            access_log=True
+            access_log=True,
+            workers=workers
         )
         
     except Exception as e:
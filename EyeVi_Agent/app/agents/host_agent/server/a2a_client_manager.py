@@ -35,6 +35,9 @@ class ChatHistory:
         self.messages: List[Dict[str, Any]] = []
         self.created_at = datetime.now()
         self.last_updated = datetime.now()
+        # Cached metadata để list sessions không phải touch messages list
+        self._preview: str = ""
+        self._count: int = 0
     
     def add_message(self, role: str, content: str, clarified_content: str, agent_used: Optional[str] = None, user_id: Optional[str] = None):
         """Thêm message vào lịch sử"""
@@ -51,6 +54,18 @@ class ChatHistory:
 
         self.messages.append(message)
         self.last_updated = datetime.now()
+        self._preview = content[:100] + "..."
+        self._count += 1
+    
+    @property
+    def message_count(self) -> int:
+        """Số lượng messages trong lịch sử (cached, không touch messages list)"""
+        return self._count
+    
+    @property
+    def last_message_preview(self) -> str:
+        """Preview 100 ký tự đầu của message cuối (cached)"""
+        return self._preview
     
     def get_recent_messages(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Lấy các message gần đây"""
@@ -84,15 +99,19 @@ class ChatHistory:
         chat_history.messages = data.get("messages", [])
         chat_history.created_at = datetime.fromisoformat(data.get("created_at", datetime.now().isoformat()))
         chat_history.last_updated = datetime.fromisoformat(data.get("last_updated", datetime.now().isoformat()))
+        chat_history._count = len(chat_history.messages)
+        if chat_history.messages:
+            chat_history._preview = chat_history.messages[-1]["content"][:100] + "..."
         return chat_history
 
 class A2AAgentClient:
     """Wrapper class cho một A2A client cụ thể"""
     
-    def __init__(self, agent_name: str, base_url: str):
+    def __init__(self, agent_name: str, base_url: str, httpx_client: Optional[httpx.AsyncClient] = None):
         self.agent_name = agent_name
         self.base_url = base_url
-        self.httpx_client = None
+        self.httpx_client = httpx_client
+        self._owns_httpx_client = httpx_client is None
         self.a2a_client = None
         self.agent_card = None
         self.is_initialized = False
@@ -107,8 +126,9 @@ class A2AAgentClient:
         try:
             logger.info(f"🔄 Khởi tạo A2A client cho {self.agent_name} tại {self.base_url}")
             
-            # Tạo httpx client
-            self.httpx_client = httpx.AsyncClient(timeout=30.0)
+            # Tạo httpx client riêng nếu không được share client từ app
+            if self.httpx_client is None:
+                self.httpx_client = httpx.AsyncClient(timeout=30.0)
             
             # Khởi tạo A2ACardResolver để fetch agent card
             resolver = A2ACardResolver(
@@ -167,18 +187,18 @@ class A2AAgentClient:
                     'text': full_message
                 })
             
-            # Thêm files nếu có
+            # Thêm files nếu có - tất cả files đi chung trong MỘT message
+            # envelope để chỉ tốn một round-trip A2A thay vì N
             if files:
-                for file_info in files:
-                    parts.append({
-                        'kind': 'file',
-                        'file': {
-                            'name': file_info.name,
-                            'mimeType': file_info.mime_type,
-                            'bytes': file_info.data  # base64 encoded
-                        }
-                    })
-                    logger.info(f"📎 Thêm file vào message: {file_info.name} ({file_info.mime_type})")
+                parts.extend({
+                    'kind': 'file',
+                    'file': {
+                        'name': file_info.name,
+                        'mimeType': file_info.mime_type,
+                        'bytes': file_info.data  # base64 encoded
+                    }
+                } for file_info in files)
+                logger.info(f"📎 Đính kèm {len(files)} files vào message: {', '.join(f.name for f in files)}")
             
             # Chuẩn bị message payload theo A2A format
             send_message_payload: Dict[str, Any] = {
@@ -265,7 +285,8 @@ class A2AAgentClient:
     async def close(self):
         """Đóng connections"""
         try:
-            if self.httpx_client:
+            # Chỉ đóng client do chính mình tạo - shared client do app quản lý
+            if self.httpx_client and self._owns_httpx_client:
                 await self.httpx_client.aclose()
             logger.info(f"✅ Đã đóng A2A client cho {self.agent_name}")
         except Exception as e:
@@ -303,8 +324,12 @@ class A2AClientManager:
             }
         }
 
-    async def initialize(self):
-        """Khởi tạo tất cả A2A clients và Redis connection"""
+    async def initialize(self, http_client: Optional[httpx.AsyncClient] = None):
+        """Khởi tạo tất cả A2A clients và Redis connection
+        
+        Args:
+            http_client: httpx.AsyncClient dùng chung cho tất cả agents (optional)
+        """
         logger.info("🚀 Khởi tạo A2A Client Manager...")
         
         # Khởi tạo Redis connection
@@ -333,7 +358,8 @@ class A2AClientManager:
             if config["enabled"]:
                 self.agents[agent_name] = A2AAgentClient(
                     agent_name=agent_name,
-                    base_url=config["url"]
+                    base_url=config["url"],
+                    httpx_client=http_client
                 )
                 
                 # Thử khởi tạo ngay (không chặn nếu agent không available)
@@ -458,13 +484,17 @@ class A2AClientManager:
         return available
 
     async def health_check_all(self) -> Dict[str, Any]:
-        """Health check tất cả agents"""
-        results = {}
+        """Health check tất cả agents (ping song song, không tuần tự)"""
+        agent_clients = list(self.agents.items())
+        health_results = await asyncio.gather(
+            *[agent_client.health_check() for _, agent_client in agent_clients],
+            return_exceptions=True
+        )
         
-        for agent_name, agent_client in self.agents.items():
-            is_healthy = await agent_client.health_check()
+        results = {}
+        for (agent_name, agent_client), is_healthy in zip(agent_clients, health_results):
             results[agent_name] = {
-                "healthy": is_healthy,
+                "healthy": is_healthy is True,
                 "url": agent_client.base_url,
                 "initialized": agent_client.is_initialized,
                 "last_check": agent_client.last_health_check.isoformat() if agent_client.last_health_check else None
@@ -37,8 +37,12 @@ class HostServer:
         # MySQL Message History cho real-time logging
         self.mysql_history = MySQLMessageHistory()
 
-    async def initialize(self):
-        """Khởi tạo các components cần thiết"""
+    async def initialize(self, http_client=None):
+        """Khởi tạo các components cần thiết
+        
+        Args:
+            http_client: httpx.AsyncClient dùng chung cho các A2A calls (optional)
+        """
         try:
             # Khởi tạo Google Generative AI
             api_key = os.getenv("GOOGLE_API_KEY")
@@ -55,7 +59,7 @@ class HostServer:
             await self._setup_orchestrator_chain()
             
             # Khởi tạo A2A Client Manager
-            await self.a2a_client_manager.initialize()
+            await self.a2a_client_manager.initialize(http_client=http_client)
             
             # Khởi tạo Enhanced Memory Manager
             self.memory_manager = EnhancedMemoryManager(
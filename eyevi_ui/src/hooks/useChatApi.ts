@@ -181,27 +181,37 @@ export const useChatApi = () => {
         }
       }
 
-      // Tạo FormData để gửi request
-      const formData = new FormData();
-      formData.append("message", content);
-      formData.append("user_id", FIXED_USER_ID.toString());
-      formData.append("session_id", currentSessionId);
-
       console.log("Sending message with session:", currentSessionId);
-      
-      // Thêm files nếu có
+
+      let response: Response;
+
       if (attachments && attachments.length > 0) {
+        // Có file đính kèm - gửi multipart đến /chat
+        const formData = new FormData();
+        formData.append("message", content);
+        formData.append("user_id", FIXED_USER_ID.toString());
+        formData.append("session_id", currentSessionId);
         attachments.forEach(file => {
           formData.append("files", file);
         });
+        console.log("formdata: ", formData)
+
+        response = await fetchWithTimeout(`${API_BASE_URL}/chat`, {
+          method: "POST",
+          body: formData,
+        });
+      } else {
+        // Chỉ có text - dùng fast path JSON /chat/text, server bỏ qua multipart parsing
+        response = await fetchWithTimeout(`${API_BASE_URL}/chat/text`, {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({
+            message: content,
+            user_id: FIXED_USER_ID.toString(),
+            session_id: currentSessionId,
+          }),
+        });
       }
-      console.log("formdata: ", formData)
-      
-      // Gửi request đến Host Agent với timeout
-      const response = await fetchWithTimeout(`${API_BASE_URL}/chat`, {
-        method: "POST",
-        body: formData,
-      });
       console.log("response: ", response)
       if (!response.ok) {
         throw new Error(`Lỗi: ${response.status}`);